@@ -89,6 +89,7 @@ name | downcase | truncate(10)
         indent: "  ".to_string(), // 2 spaces instead of 4
         include_runtime_imports: true,
         type_hints: true,
+        runtime_module: None,
     };
 
     let simple_rule_custom = "if x > 10 :high else :low end";
@@ -0,0 +1,35 @@
+# cython: language_level=3
+#
+# Augmenting declarations for runtime.py.
+#
+# When runtime.py is compiled with Cython (see setup.py) these declarations
+# turn the listed helpers into cpdef functions with C-typed signatures. The
+# Python source stays the single source of truth and is still importable
+# without a compiler.
+
+# Truthiness and type predicates return C booleans
+cpdef bint is_truthy(object val)
+cpdef bint is_number(object val)
+cpdef bint is_string(object val)
+cpdef bint is_boolean(object val)
+cpdef bint is_nil(object val)
+cpdef bint is_array(object val)
+cpdef bint is_dictionary(object val)
+
+# Shared slow path of the arithmetic type guard, callable only from C
+cdef _check_num2(object a, object b, str name)
+
+# Arithmetic helpers keep object results so that int inputs stay ints
+cpdef object plus(object a, object b)
+cpdef object minus(object a, object b)
+cpdef object times(object a, object b)
+cpdef object divided_by(object a, object b)
+cpdef object modulo(object a, object b)
+
+# Collection and logic helpers
+cpdef object size(object val)
+cpdef object at(object arr, object index)
+cpdef object choose(object index, object arr)
+cpdef object if_then_else(object condition, object then_val, object else_val)
+cpdef object coalesce(object a, object b)
+cpdef object default(object val, object default_val)
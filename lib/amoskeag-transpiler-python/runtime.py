@@ -9,6 +9,67 @@ Amoskeag functional programming semantics.
 from typing import Any, Dict, List, Optional, Union
 import math
 
+# Cached builtin types for identity-based type guards. In the common
+# monomorphic case ``type(x) is _INT`` is a single pointer comparison; the
+# ``isinstance`` fallback only runs when the fast check misses, so subclasses
+# (including bool as an int) keep their previous behaviour.
+_INT = int
+_FLOAT = float
+_STR = str
+_LIST = list
+_DICT = dict
+_NUMBER = (int, float)
+
+
+def _type_err(expected: str, val: Any) -> str:
+    """
+    Format the message for a failed type guard.
+
+    Keeping the formatting here leaves a single call in each helper's cold
+    path instead of an inlined f-string.
+    """
+    return f"{expected}, got {type(val).__name__}"
+
+
+def _check_num2(a: Any, b: Any, name: str) -> None:
+    """
+    Slow path of the two-number guard shared by the arithmetic helpers.
+
+    The helpers inline only the exact int/float identity test; this accepts
+    int and float subclasses (bool included) and raises for anything else.
+    """
+    if not isinstance(a, _NUMBER):
+        raise TypeError(_type_err(f"{name} expects numbers", a))
+    if not isinstance(b, _NUMBER):
+        raise TypeError(_type_err(f"{name} expects numbers", b))
+
+
+# ASCII strings at least this long are case-mapped through StringZilla's
+# byte translation when it is installed; below it str.upper/str.lower win.
+_STRINGZILLA_MIN_SIZE = 4096
+
+# ASCII haystacks at least this long are pre-scanned with StringZilla in
+# replace(); below it the scan's setup outweighs its speed.
+_STRINGZILLA_REPLACE_MIN_SIZE = 65536
+
+_sz = None
+
+# 256-byte lookup tables mapping ASCII letters to the other case
+_UPPER_TABLE = bytes(c - 32 if 97 <= c <= 122 else c for c in range(256))
+_LOWER_TABLE = bytes(c + 32 if 65 <= c <= 90 else c for c in range(256))
+
+
+def _stringzilla() -> Any:
+    """Import StringZilla lazily; returns None when it is not installed."""
+    global _sz
+    if _sz is None:
+        try:
+            import stringzilla
+            _sz = stringzilla
+        except ImportError:
+            _sz = False
+    return _sz or None
+
 
 def get_nested(obj: Any, *keys: str) -> Any:
     """
@@ -18,16 +79,39 @@ def get_nested(obj: Any, *keys: str) -> Any:
     This implements Amoskeag's safe navigation semantics.
     """
     current = obj
+    _dict = _DICT
     for key in keys:
-        if isinstance(current, dict):
-            current = current.get(key)
-        else:
+        if type(current) is not _dict and not isinstance(current, _dict):
             return None
+        current = current.get(key)
         if current is None:
             return None
     return current
 
 
+def get_nested2(obj: Any, key1: str, key2: str) -> Any:
+    """get_nested with two keys, without packing them into a tuple."""
+    if type(obj) is not _DICT and not isinstance(obj, _DICT):
+        return None
+    current = obj.get(key1)
+    if type(current) is not _DICT and not isinstance(current, _DICT):
+        return None
+    return current.get(key2)
+
+
+def get_nested3(obj: Any, key1: str, key2: str, key3: str) -> Any:
+    """get_nested with three keys, without packing them into a tuple."""
+    if type(obj) is not _DICT and not isinstance(obj, _DICT):
+        return None
+    current = obj.get(key1)
+    if type(current) is not _DICT and not isinstance(current, _DICT):
+        return None
+    current = current.get(key2)
+    if type(current) is not _DICT and not isinstance(current, _DICT):
+        return None
+    return current.get(key3)
+
+
 def is_truthy(val: Any) -> bool:
     """
     Check if a value is truthy in Amoskeag semantics.
@@ -36,78 +120,100 @@ def is_truthy(val: Any) -> bool:
     - Boolean False is falsy
     - Everything else is truthy
     """
-    if val is None:
-        return False
-    if isinstance(val, bool):
-        return val
-    return True
+    return val is not None and val is not False
 
 
 # String Functions
 
 def upcase(s: Any) -> str:
     """Convert string to uppercase."""
-    if not isinstance(s, str):
-        raise TypeError(f"upcase expects a string, got {type(s).__name__}")
+    if type(s) is not _STR and not isinstance(s, _STR):
+        raise TypeError(_type_err("upcase expects a string", s))
+    if len(s) >= _STRINGZILLA_MIN_SIZE and s.isascii():
+        sz = _stringzilla()
+        if sz is not None:
+            return sz.translate(s, _UPPER_TABLE)
     return s.upper()
 
 
 def downcase(s: Any) -> str:
     """Convert string to lowercase."""
-    if not isinstance(s, str):
-        raise TypeError(f"downcase expects a string, got {type(s).__name__}")
+    if type(s) is not _STR and not isinstance(s, _STR):
+        raise TypeError(_type_err("downcase expects a string", s))
+    if len(s) >= _STRINGZILLA_MIN_SIZE and s.isascii():
+        sz = _stringzilla()
+        if sz is not None:
+            return sz.translate(s, _LOWER_TABLE)
     return s.lower()
 
 
 def capitalize(s: Any) -> str:
     """Capitalize the first letter of a string."""
-    if not isinstance(s, str):
-        raise TypeError(f"capitalize expects a string, got {type(s).__name__}")
+    if type(s) is not _STR and not isinstance(s, _STR):
+        raise TypeError(_type_err("capitalize expects a string", s))
     return s.capitalize()
 
 
 def strip(s: Any) -> str:
     """Remove leading and trailing whitespace."""
-    if not isinstance(s, str):
-        raise TypeError(f"strip expects a string, got {type(s).__name__}")
+    if type(s) is not _STR and not isinstance(s, _STR):
+        raise TypeError(_type_err("strip expects a string", s))
     return s.strip()
 
 
 def split(s: Any, sep: Any) -> List[str]:
     """Split a string by separator."""
-    if not isinstance(s, str):
-        raise TypeError(f"split expects a string, got {type(s).__name__}")
-    if not isinstance(sep, str):
-        raise TypeError(f"split separator must be a string, got {type(sep).__name__}")
+    if type(s) is not _STR and not isinstance(s, _STR):
+        raise TypeError(_type_err("split expects a string", s))
+    if type(sep) is not _STR and not isinstance(sep, _STR):
+        raise TypeError(_type_err("split separator must be a string", sep))
+    if not sep:
+        # str.split rejects an empty separator; Amoskeag splits between every
+        # character, with empty strings at both ends.
+        return ['', *s, '']
     return s.split(sep)
 
 
 def join(arr: Any, sep: Any) -> str:
     """Join an array of strings with a separator."""
-    if not isinstance(arr, list):
-        raise TypeError(f"join expects a list, got {type(arr).__name__}")
-    if not isinstance(sep, str):
-        raise TypeError(f"join separator must be a string, got {type(sep).__name__}")
-    return sep.join(str(x) for x in arr)
+    if type(arr) is not _LIST and not isinstance(arr, _LIST):
+        raise TypeError(_type_err("join expects a list", arr))
+    if type(sep) is not _STR and not isinstance(sep, _STR):
+        raise TypeError(_type_err("join separator must be a string", sep))
+    try:
+        # Common case: already a list of strings, joined without conversion
+        return sep.join(arr)
+    except TypeError:
+        return sep.join(x if type(x) is _STR else str(x) for x in arr)
 
 
 def truncate(s: Any, length: Any) -> str:
     """Truncate a string to a maximum length."""
-    if not isinstance(s, str):
-        raise TypeError(f"truncate expects a string, got {type(s).__name__}")
-    if not isinstance(length, (int, float)):
-        raise TypeError(f"truncate length must be a number, got {type(length).__name__}")
+    if type(s) is not _STR and not isinstance(s, _STR):
+        raise TypeError(_type_err("truncate expects a string", s))
+    t = type(length)
+    if t is not _INT and t is not _FLOAT and not isinstance(length, _NUMBER):
+        raise TypeError(_type_err("truncate length must be a number", length))
     return s[:int(length)]
 
 
 def replace(s: Any, find: Any, replacement: Any) -> str:
     """Replace all occurrences of find with replacement."""
-    if not isinstance(s, str):
-        raise TypeError(f"replace expects a string, got {type(s).__name__}")
-    if not isinstance(find, str):
-        raise TypeError(f"replace find must be a string, got {type(find).__name__}")
-    if not isinstance(replacement, str):
-        raise TypeError(f"replace replacement must be a string, got {type(replacement).__name__}")
+    if type(s) is not _STR and not isinstance(s, _STR):
+        raise TypeError(_type_err("replace expects a string", s))
+    if type(find) is not _STR and not isinstance(find, _STR):
+        raise TypeError(_type_err("replace find must be a string", find))
+    if type(replacement) is not _STR and not isinstance(replacement, _STR):
+        raise TypeError(_type_err("replace replacement must be a string", replacement))
+    if len(s) >= _STRINGZILLA_REPLACE_MIN_SIZE and s.isascii():
+        sz = _stringzilla()
+        # str.replace already returns s itself when nothing matches; the SIMD
+        # scan only finds that out faster. Matching strings pay for the extra
+        # scan and are still rewritten by str.replace, which beats splicing
+        # the result together from StringZilla offsets. ASCII only: for other
+        # strings CPython would build and cache a UTF-8 copy for sz.Str.
+        if sz is not None and sz.Str(s).find(find) < 0:
+            return s
     return s.replace(find, replacement)
 
 
@@ -115,67 +221,72 @@ def replace(s: Any, find: Any, replacement: Any) -> str:
 
 def abs_num(n: Any) -> float:
     """Return the absolute value of a number."""
-    if not isinstance(n, (int, float)):
-        raise TypeError(f"abs expects a number, got {type(n).__name__}")
+    t = type(n)
+    if t is not _INT and t is not _FLOAT and not isinstance(n, _NUMBER):
+        raise TypeError(_type_err("abs expects a number", n))
     return abs(n)
 
 
 def ceil_num(n: Any) -> float:
     """Round a number up to the nearest integer."""
-    if not isinstance(n, (int, float)):
-        raise TypeError(f"ceil expects a number, got {type(n).__name__}")
+    t = type(n)
+    if t is not _INT and t is not _FLOAT and not isinstance(n, _NUMBER):
+        raise TypeError(_type_err("ceil expects a number", n))
     return math.ceil(n)
 
 
 def floor_num(n: Any) -> float:
     """Round a number down to the nearest integer."""
-    if not isinstance(n, (int, float)):
-        raise TypeError(f"floor expects a number, got {type(n).__name__}")
+    t = type(n)
+    if t is not _INT and t is not _FLOAT and not isinstance(n, _NUMBER):
+        raise TypeError(_type_err("floor expects a number", n))
     return math.floor(n)
 
 
 def round_num(n: Any, digits: Any = 0) -> float:
     """Round a number to a specified number of decimal places."""
-    if not isinstance(n, (int, float)):
-        raise TypeError(f"round expects a number, got {type(n).__name__}")
-    if not isinstance(digits, (int, float)):
-        raise TypeError(f"round digits must be a number, got {type(digits).__name__}")
+    t = type(n)
+    if t is not _INT and t is not _FLOAT and not isinstance(n, _NUMBER):
+        raise TypeError(_type_err("round expects a number", n))
+    t = type(digits)
+    if t is not _INT and t is not _FLOAT and not isinstance(digits, _NUMBER):
+        raise TypeError(_type_err("round digits must be a number", digits))
     return round(n, int(digits))
 
 
 def plus(a: Any, b: Any) -> float:
     """Add two numbers."""
-    if not isinstance(a, (int, float)):
-        raise TypeError(f"plus expects numbers, got {type(a).__name__}")
-    if not isinstance(b, (int, float)):
-        raise TypeError(f"plus expects numbers, got {type(b).__name__}")
+    ta = type(a)
+    tb = type(b)
+    if (ta is not _INT and ta is not _FLOAT) or (tb is not _INT and tb is not _FLOAT):
+        _check_num2(a, b, "plus")
     return a + b
 
 
 def minus(a: Any, b: Any) -> float:
     """Subtract two numbers."""
-    if not isinstance(a, (int, float)):
-        raise TypeError(f"minus expects numbers, got {type(a).__name__}")
-    if not isinstance(b, (int, float)):
-        raise TypeError(f"minus expects numbers, got {type(b).__name__}")
+    ta = type(a)
+    tb = type(b)
+    if (ta is not _INT and ta is not _FLOAT) or (tb is not _INT and tb is not _FLOAT):
+        _check_num2(a, b, "minus")
     return a - b
 
 
 def times(a: Any, b: Any) -> float:
     """Multiply two numbers."""
-    if not isinstance(a, (int, float)):
-        raise TypeError(f"times expects numbers, got {type(a).__name__}")
-    if not isinstance(b, (int, float)):
-        raise TypeError(f"times expects numbers, got {type(b).__name__}")
+    ta = type(a)
+    tb = type(b)
+    if (ta is not _INT and ta is not _FLOAT) or (tb is not _INT and tb is not _FLOAT):
+        _check_num2(a, b, "times")
     return a * b
 
 
 def divided_by(a: Any, b: Any) -> float:
     """Divide two numbers."""
-    if not isinstance(a, (int, float)):
-        raise TypeError(f"divided_by expects numbers, got {type(a).__name__}")
-    if not isinstance(b, (int, float)):
-        raise TypeError(f"divided_by expects numbers, got {type(b).__name__}")
+    ta = type(a)
+    tb = type(b)
+    if (ta is not _INT and ta is not _FLOAT) or (tb is not _INT and tb is not _FLOAT):
+        _check_num2(a, b, "divided_by")
     if b == 0:
         raise ZeroDivisionError("Division by zero")
     return a / b
@@ -183,10 +294,10 @@ def divided_by(a: Any, b: Any) -> float:
 
 def modulo(a: Any, b: Any) -> float:
     """Calculate modulo of two numbers."""
-    if not isinstance(a, (int, float)):
-        raise TypeError(f"modulo expects numbers, got {type(a).__name__}")
-    if not isinstance(b, (int, float)):
-        raise TypeError(f"modulo expects numbers, got {type(b).__name__}")
+    ta = type(a)
+    tb = type(b)
+    if (ta is not _INT and ta is not _FLOAT) or (tb is not _INT and tb is not _FLOAT):
+        _check_num2(a, b, "modulo")
     return a % b
 
 
@@ -196,43 +307,70 @@ def size(val: Any) -> int:
     """Get the size/length of a collection or string."""
     if val is None:
         return 0
-    if isinstance(val, (list, dict, str)):
+    t = type(val)
+    if t is _LIST or t is _DICT or t is _STR or isinstance(val, (_LIST, _DICT, _STR)):
         return len(val)
-    raise TypeError(f"size expects a collection or string, got {type(val).__name__}")
+    raise TypeError(_type_err("size expects a collection or string", val))
 
 
 def first(arr: Any) -> Any:
     """Get the first element of an array."""
-    if not isinstance(arr, list):
-        raise TypeError(f"first expects a list, got {type(arr).__name__}")
+    if type(arr) is not _LIST and not isinstance(arr, _LIST):
+        raise TypeError(_type_err("first expects a list", arr))
     return arr[0] if arr else None
 
 
 def last(arr: Any) -> Any:
     """Get the last element of an array."""
-    if not isinstance(arr, list):
-        raise TypeError(f"last expects a list, got {type(arr).__name__}")
+    if type(arr) is not _LIST and not isinstance(arr, _LIST):
+        raise TypeError(_type_err("last expects a list", arr))
     return arr[-1] if arr else None
 
 
 def contains(arr: Any, val: Any) -> bool:
     """Check if an array contains a value."""
-    if not isinstance(arr, list):
-        raise TypeError(f"contains expects a list, got {type(arr).__name__}")
+    if type(arr) is not _LIST and not isinstance(arr, _LIST):
+        raise TypeError(_type_err("contains expects a list", arr))
     return val in arr
 
 
+def contains_many(arr: Any, vals: Any) -> List[bool]:
+    """
+    Check membership of each of vals in an array.
+
+    Equivalent to ``[contains(arr, v) for v in vals]`` but O(N + M) rather
+    than O(N * M): the array is hashed once and each value is a set lookup.
+    Arrays holding unhashable elements (lists, dictionaries) fall back to
+    linear scans.
+    """
+    if type(arr) is not _LIST and not isinstance(arr, _LIST):
+        raise TypeError(_type_err("contains_many expects a list", arr))
+    if type(vals) is not _LIST and not isinstance(vals, _LIST):
+        raise TypeError(_type_err("contains_many values must be a list", vals))
+    try:
+        members = set(arr)
+    except TypeError:
+        return [v in arr for v in vals]
+    result = []
+    for v in vals:
+        try:
+            result.append(v in members)
+        except TypeError:
+            result.append(v in arr)
+    return result
+
+
 def sum_arr(arr: Any) -> float:
     """Sum all numbers in an array."""
-    if not isinstance(arr, list):
-        raise TypeError(f"sum expects a list, got {type(arr).__name__}")
+    if type(arr) is not _LIST and not isinstance(arr, _LIST):
+        raise TypeError(_type_err("sum expects a list", arr))
     return sum(arr)
 
 
 def avg(arr: Any) -> Optional[float]:
     """Calculate the average of numbers in an array."""
-    if not isinstance(arr, list):
-        raise TypeError(f"avg expects a list, got {type(arr).__name__}")
+    if type(arr) is not _LIST and not isinstance(arr, _LIST):
+        raise TypeError(_type_err("avg expects a list", arr))
     if not arr:
         return None
     return sum(arr) / len(arr)
@@ -240,39 +378,78 @@ def avg(arr: Any) -> Optional[float]:
 
 def sort_arr(arr: Any) -> List[Any]:
     """Sort an array."""
-    if not isinstance(arr, list):
-        raise TypeError(f"sort expects a list, got {type(arr).__name__}")
+    if type(arr) is not _LIST and not isinstance(arr, _LIST):
+        raise TypeError(_type_err("sort expects a list", arr))
     return sorted(arr)
 
 
+def sort_arr_inplace(arr: Any) -> List[Any]:
+    """
+    Sort an array in place and return it.
+
+    Only for lists the caller owns outright (e.g. just produced by split);
+    sort_arr is the safe default that leaves its input untouched.
+    """
+    if type(arr) is not _LIST and not isinstance(arr, _LIST):
+        raise TypeError(_type_err("sort expects a list", arr))
+    arr.sort()
+    return arr
+
+
 def keys(d: Any) -> List[str]:
     """Get the keys of a dictionary."""
-    if not isinstance(d, dict):
-        raise TypeError(f"keys expects a dictionary, got {type(d).__name__}")
-    return list(d.keys())
+    if type(d) is not _DICT and not isinstance(d, _DICT):
+        raise TypeError(_type_err("keys expects a dictionary", d))
+    return [*d]
 
 
 def values(d: Any) -> List[Any]:
     """Get the values of a dictionary."""
-    if not isinstance(d, dict):
-        raise TypeError(f"values expects a dictionary, got {type(d).__name__}")
-    return list(d.values())
+    if type(d) is not _DICT and not isinstance(d, _DICT):
+        raise TypeError(_type_err("values expects a dictionary", d))
+    return [*d.values()]
+
+
+def keys_view(d: Any) -> Any:
+    """
+    Get a read-only view of the keys of a dictionary.
+
+    Unlike keys() no list is built; use it where the result is only
+    iterated or measured. Membership tests on the view hash the value, so
+    unlike a list they raise TypeError for unhashable values.
+    """
+    if type(d) is not _DICT and not isinstance(d, _DICT):
+        raise TypeError(_type_err("keys expects a dictionary", d))
+    return d.keys()
+
+
+def values_view(d: Any) -> Any:
+    """
+    Get a read-only view of the values of a dictionary.
+
+    Unlike values() no list is built; use it where the result is only
+    iterated, measured or tested for membership.
+    """
+    if type(d) is not _DICT and not isinstance(d, _DICT):
+        raise TypeError(_type_err("values expects a dictionary", d))
+    return d.values()
 
 
 def reverse(arr: Any) -> List[Any]:
     """Reverse an array."""
-    if not isinstance(arr, list):
-        raise TypeError(f"reverse expects a list, got {type(arr).__name__}")
-    return list(reversed(arr))
+    if type(arr) is not _LIST and not isinstance(arr, _LIST):
+        raise TypeError(_type_err("reverse expects a list", arr))
+    return arr[::-1]
 
 
 def at(arr: Any, index: Any) -> Any:
     """Get element at index (0-based)."""
-    if not isinstance(arr, list):
-        raise TypeError(f"at expects a list, got {type(arr).__name__}")
-    if not isinstance(index, (int, float)):
-        raise TypeError(f"at index must be a number, got {type(index).__name__}")
-    idx = int(index)
+    if type(arr) is not _LIST and not isinstance(arr, _LIST):
+        raise TypeError(_type_err("at expects a list", arr))
+    t = type(index)
+    if t is not _INT and t is not _FLOAT and not isinstance(index, _NUMBER):
+        raise TypeError(_type_err("at index must be a number", index))
+    idx = index if t is _INT else int(index)
     return arr[idx] if 0 <= idx < len(arr) else None
 
 
@@ -284,33 +461,36 @@ def choose(index: Any, arr: Any) -> Any:
 
     This matches Excel's CHOOSE function behavior.
     """
-    if not isinstance(index, (int, float)):
-        raise TypeError(f"choose index must be a number, got {type(index).__name__}")
-    if not isinstance(arr, list):
-        raise TypeError(f"choose expects a list, got {type(arr).__name__}")
+    t = type(index)
+    if t is not _INT and t is not _FLOAT and not isinstance(index, _NUMBER):
+        raise TypeError(_type_err("choose index must be a number", index))
+    if type(arr) is not _LIST and not isinstance(arr, _LIST):
+        raise TypeError(_type_err("choose expects a list", arr))
 
-    idx = int(index) - 1  # Convert to 0-based
-    return arr[idx] if 0 <= idx < len(arr) else None
+    idx = index if t is _INT else int(index)
+    return arr[idx - 1] if 0 < idx <= len(arr) else None
 
 
 def if_then_else(condition: Any, then_val: Any, else_val: Any) -> Any:
     """Conditional expression."""
-    return then_val if is_truthy(condition) else else_val
+    # is_truthy, inlined to avoid a second call on every conditional
+    return then_val if condition is not None and condition is not False else else_val
 
 
 def is_number(val: Any) -> bool:
     """Check if value is a number."""
-    return isinstance(val, (int, float))
+    t = type(val)
+    return t is _INT or t is _FLOAT or isinstance(val, _NUMBER)
 
 
 def is_string(val: Any) -> bool:
     """Check if value is a string."""
-    return isinstance(val, str)
+    return type(val) is _STR or isinstance(val, _STR)
 
 
 def is_boolean(val: Any) -> bool:
     """Check if value is a boolean."""
-    return isinstance(val, bool)
+    return val is True or val is False
 
 
 def is_nil(val: Any) -> bool:
@@ -320,12 +500,12 @@ def is_nil(val: Any) -> bool:
 
 def is_array(val: Any) -> bool:
     """Check if value is an array (list)."""
-    return isinstance(val, list)
+    return type(val) is _LIST or isinstance(val, _LIST)
 
 
 def is_dictionary(val: Any) -> bool:
     """Check if value is a dictionary."""
-    return isinstance(val, dict)
+    return type(val) is _DICT or isinstance(val, _DICT)
 
 
 def coalesce(a: Any, b: Any) -> Any:
@@ -341,6 +521,8 @@ def default(val: Any, default_val: Any) -> Any:
 # Export all public functions
 __all__ = [
     'get_nested',
+    'get_nested2',
+    'get_nested3',
     'is_truthy',
     # String functions
     'upcase',
@@ -366,11 +548,15 @@ __all__ = [
     'first',
     'last',
     'contains',
+    'contains_many',
     'sum_arr',
     'avg',
     'sort_arr',
+    'sort_arr_inplace',
     'keys',
     'values',
+    'keys_view',
+    'values_view',
     'reverse',
     'at',
     # Logic functions
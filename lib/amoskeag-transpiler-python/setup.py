@@ -0,0 +1,25 @@
+"""
+Optional native build of the Amoskeag Python runtime.
+
+Compiles runtime.py (together with the augmenting declarations in
+runtime.pxd) into an extension module with Cython. The compiled module is
+picked up in preference to runtime.py by the regular import machinery, so
+transpiled programs need no changes to benefit from it:
+
+    pip install cython
+    python setup.py build_ext --inplace
+"""
+
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name="amoskeag-runtime",
+    ext_modules=cythonize(
+        "runtime.py",
+        # boundscheck/wraparound/cdivision are deliberately left at their
+        # defaults: the runtime relies on negative indexing (last) and on
+        # Python's floor-division and modulo semantics.
+        language_level=3,
+    ),
+)
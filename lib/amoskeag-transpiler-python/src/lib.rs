@@ -27,6 +27,10 @@ pub struct TranspileConfig {
     pub include_runtime_imports: bool,
     /// Whether to generate type hints
     pub type_hints: bool,
+    /// Python module to import the runtime helpers from (e.g. `runtime`, the
+    /// module built from runtime.py). When `None`, the helpers are emitted
+    /// inline so the generated code is self-contained.
+    pub runtime_module: Option<String>,
 }
 
 impl Default for TranspileConfig {
@@ -35,10 +39,20 @@ impl Default for TranspileConfig {
             indent: "    ".to_string(),
             include_runtime_imports: true,
             type_hints: true,
+            runtime_module: None,
         }
     }
 }
 
+/// Runtime functions used by generated code, which binds each as `_<name>`
+const RUNTIME_HELPERS: &[&str] = &[
+    "get_nested",
+    "get_nested2",
+    "get_nested3",
+    "is_truthy",
+    "sort_arr_inplace",
+];
+
 /// Transpile an Amoskeag AST to Python code
 ///
 /// # Arguments
@@ -61,6 +75,20 @@ pub fn transpile(expr: &Expr, config: &TranspileConfig) -> Result<String, Transp
         .map_err(|e| TranspileError::FormatError(e.to_string()))?;
     }
 
+    // Bind the helpers, either from the shared runtime module or inline
+    match &config.runtime_module {
+        Some(module) => {
+            let imports = RUNTIME_HELPERS
+                .iter()
+                .map(|name| format!("{} as _{}", name, name))
+                .collect::<Vec<_>>()
+                .join(", ");
+            writeln!(&mut output, "from {} import {}\n\n", module, imports)
+                .map_err(|e| TranspileError::FormatError(e.to_string()))?;
+        }
+        None => generate_helpers(&mut output, &config.indent)?,
+    }
+
     // Generate the main function
     writeln!(&mut output, "def evaluate(data: Dict[str, Any]) -> Any:")
         .map_err(|e| TranspileError::FormatError(e.to_string()))?;
@@ -71,9 +99,6 @@ pub fn transpile(expr: &Expr, config: &TranspileConfig) -> Result<String, Transp
     )
     .map_err(|e| TranspileError::FormatError(e.to_string()))?;
 
-    // Generate helper functions
-    generate_helpers(&mut output, &config.indent)?;
-
     // Generate the main expression
     writeln!(
         &mut output,
@@ -87,75 +112,128 @@ pub fn transpile(expr: &Expr, config: &TranspileConfig) -> Result<String, Transp
 }
 
 /// Generate helper functions for the Python runtime
+///
+/// The helpers are emitted at module level, once, rather than being redefined
+/// on every call to `evaluate`, so call sites resolve them as globals.
 fn generate_helpers(output: &mut String, indent: &str) -> Result<(), TranspileError> {
     // Helper for safe dictionary access
+    writeln!(output, "def _get_nested(obj: Any, *keys: str) -> Any:")
+        .map_err(|e| TranspileError::FormatError(e.to_string()))?;
     writeln!(
         output,
-        "{}def _get_nested(obj: Any, *keys: str) -> Any:",
+        "{}\"\"\"Safely navigate nested dictionaries.\"\"\"",
         indent
     )
     .map_err(|e| TranspileError::FormatError(e.to_string()))?;
+    writeln!(output, "{}current = obj", indent)
+        .map_err(|e| TranspileError::FormatError(e.to_string()))?;
+    writeln!(output, "{}for key in keys:", indent)
+        .map_err(|e| TranspileError::FormatError(e.to_string()))?;
+    writeln!(output, "{}{}if isinstance(current, dict):", indent, indent)
+        .map_err(|e| TranspileError::FormatError(e.to_string()))?;
     writeln!(
         output,
-        "{}{}\"\"\"Safely navigate nested dictionaries.\"\"\"",
-        indent, indent
+        "{}{}{}current = current.get(key)",
+        indent, indent, indent
     )
     .map_err(|e| TranspileError::FormatError(e.to_string()))?;
-    writeln!(output, "{}{}current = obj", indent, indent)
+    writeln!(output, "{}{}else:", indent, indent)
+        .map_err(|e| TranspileError::FormatError(e.to_string()))?;
+    writeln!(output, "{}{}{}return None", indent, indent, indent)
+        .map_err(|e| TranspileError::FormatError(e.to_string()))?;
+    writeln!(output, "{}{}if current is None:", indent, indent)
+        .map_err(|e| TranspileError::FormatError(e.to_string()))?;
+    writeln!(output, "{}{}{}return None", indent, indent, indent)
         .map_err(|e| TranspileError::FormatError(e.to_string()))?;
-    writeln!(output, "{}{}for key in keys:", indent, indent)
+    writeln!(output, "{}return current", indent)
+        .map_err(|e| TranspileError::FormatError(e.to_string()))?;
+    writeln!(output).map_err(|e| TranspileError::FormatError(e.to_string()))?;
+    writeln!(output).map_err(|e| TranspileError::FormatError(e.to_string()))?;
+
+    // Fixed-arity variants for the common short paths (a.b, a.b.c), which
+    // avoid packing the keys into a tuple on every access
+    generate_fixed_arity_get(output, indent, 2)?;
+    generate_fixed_arity_get(output, indent, 3)?;
+
+    // Helper for truthiness
+    writeln!(output, "def _is_truthy(val: Any) -> bool:")
         .map_err(|e| TranspileError::FormatError(e.to_string()))?;
     writeln!(
         output,
-        "{}{}{}if isinstance(current, dict):",
-        indent, indent, indent
+        "{}\"\"\"Check if a value is truthy in Amoskeag.\"\"\"",
+        indent
     )
     .map_err(|e| TranspileError::FormatError(e.to_string()))?;
     writeln!(
         output,
-        "{}{}{}{}current = current.get(key)",
-        indent, indent, indent, indent
+        "{}return val is not None and val is not False",
+        indent
     )
     .map_err(|e| TranspileError::FormatError(e.to_string()))?;
-    writeln!(output, "{}{}{}else:", indent, indent, indent)
-        .map_err(|e| TranspileError::FormatError(e.to_string()))?;
+    writeln!(output).map_err(|e| TranspileError::FormatError(e.to_string()))?;
+    writeln!(output).map_err(|e| TranspileError::FormatError(e.to_string()))?;
+
+    // Helper for sorting a temporary list without copying it
     writeln!(
         output,
-        "{}{}{}{}return None",
-        indent, indent, indent, indent
+        "def _sort_arr_inplace(arr: List[Any]) -> List[Any]:"
     )
     .map_err(|e| TranspileError::FormatError(e.to_string()))?;
-    writeln!(output, "{}{}{}if current is None:", indent, indent, indent)
-        .map_err(|e| TranspileError::FormatError(e.to_string()))?;
     writeln!(
         output,
-        "{}{}{}{}return None",
-        indent, indent, indent, indent
+        "{}\"\"\"Sort a list that nothing else references, in place.\"\"\"",
+        indent
     )
     .map_err(|e| TranspileError::FormatError(e.to_string()))?;
-    writeln!(output, "{}{}return current", indent, indent)
+    writeln!(output, "{}arr.sort()", indent)
+        .map_err(|e| TranspileError::FormatError(e.to_string()))?;
+    writeln!(output, "{}return arr", indent)
         .map_err(|e| TranspileError::FormatError(e.to_string()))?;
     writeln!(output).map_err(|e| TranspileError::FormatError(e.to_string()))?;
+    writeln!(output).map_err(|e| TranspileError::FormatError(e.to_string()))?;
 
-    // Helper for truthiness
-    writeln!(output, "{}def _is_truthy(val: Any) -> bool:", indent)
+    Ok(())
+}
+
+/// Generate `_get_nested{n}`, an unrolled `_get_nested` taking exactly `n` keys
+fn generate_fixed_arity_get(
+    output: &mut String,
+    indent: &str,
+    n: usize,
+) -> Result<(), TranspileError> {
+    let params = (1..=n)
+        .map(|i| format!("key{}: str", i))
+        .collect::<Vec<_>>()
+        .join(", ");
+    writeln!(output, "def _get_nested{}(obj: Any, {}) -> Any:", n, params)
         .map_err(|e| TranspileError::FormatError(e.to_string()))?;
     writeln!(
         output,
-        "{}{}\"\"\"Check if a value is truthy in Amoskeag.\"\"\"",
-        indent, indent
+        "{}\"\"\"Safely navigate {} levels of nested dictionaries.\"\"\"",
+        indent, n
     )
     .map_err(|e| TranspileError::FormatError(e.to_string()))?;
-    writeln!(output, "{}{}if val is None:", indent, indent)
-        .map_err(|e| TranspileError::FormatError(e.to_string()))?;
-    writeln!(output, "{}{}{}return False", indent, indent, indent)
-        .map_err(|e| TranspileError::FormatError(e.to_string()))?;
-    writeln!(output, "{}{}if isinstance(val, bool):", indent, indent)
+    writeln!(output, "{}if not isinstance(obj, dict):", indent)
         .map_err(|e| TranspileError::FormatError(e.to_string()))?;
-    writeln!(output, "{}{}{}return val", indent, indent, indent)
+    writeln!(output, "{}{}return None", indent, indent)
         .map_err(|e| TranspileError::FormatError(e.to_string()))?;
-    writeln!(output, "{}{}return True", indent, indent)
+    writeln!(output, "{}current = obj.get(key1)", indent)
         .map_err(|e| TranspileError::FormatError(e.to_string()))?;
+    for i in 2..n {
+        writeln!(output, "{}if not isinstance(current, dict):", indent)
+            .map_err(|e| TranspileError::FormatError(e.to_string()))?;
+        writeln!(output, "{}{}return None", indent, indent)
+            .map_err(|e| TranspileError::FormatError(e.to_string()))?;
+        writeln!(output, "{}current = current.get(key{})", indent, i)
+            .map_err(|e| TranspileError::FormatError(e.to_string()))?;
+    }
+    writeln!(
+        output,
+        "{}return current.get(key{}) if isinstance(current, dict) else None",
+        indent, n
+    )
+    .map_err(|e| TranspileError::FormatError(e.to_string()))?;
+    writeln!(output).map_err(|e| TranspileError::FormatError(e.to_string()))?;
     writeln!(output).map_err(|e| TranspileError::FormatError(e.to_string()))?;
 
     Ok(())
@@ -200,6 +278,13 @@ fn transpile_expr(expr: &Expr, indent: &str, depth: usize) -> Result<String, Tra
             if path.len() == 1 {
                 // Simple variable - check data dict first
                 Ok(format!("data.get({:?})", path[0]))
+            } else if path.len() == 2 {
+                Ok(format!("_get_nested2(data, {:?}, {:?})", path[0], path[1]))
+            } else if path.len() == 3 {
+                Ok(format!(
+                    "_get_nested3(data, {:?}, {:?}, {:?})",
+                    path[0], path[1], path[2]
+                ))
             } else {
                 // Nested access using helper
                 let keys = path
@@ -213,9 +298,45 @@ fn transpile_expr(expr: &Expr, indent: &str, depth: usize) -> Result<String, Tra
 
         // Function call
         Expr::FunctionCall { name, args } => {
+            // join(split(s, find), sep) is s.replace(find, sep), without
+            // building the intermediate list of parts
+            if name == "join" && args.len() == 2 {
+                if let Expr::FunctionCall {
+                    name: inner,
+                    args: inner_args,
+                } = &args[0]
+                {
+                    if inner == "split" && inner_args.len() == 2 {
+                        return Ok(format!(
+                            "{}.replace({}, {})",
+                            transpile_expr(&inner_args[0], indent, depth)?,
+                            transpile_expr(&inner_args[1], indent, depth)?,
+                            transpile_expr(&args[1], indent, depth)?
+                        ));
+                    }
+                }
+            }
+
+            // These consumers only iterate, measure or test membership of
+            // their first argument, so keys()/values() need not be copied.
+            // Membership in a keys view hashes the needle, which raises for
+            // unhashable values (lists, dictionaries) where a list compares
+            // by equality, so contains only takes the values view.
+            let reads_first_arg = match name.as_str() {
+                "size" | "sum" | "avg" | "sort" | "join" => true,
+                "contains" => matches!(dict_view_call(&args[0]), Some((_, "values"))),
+                _ => false,
+            };
             let arg_codes: Result<Vec<_>, _> = args
                 .iter()
-                .map(|a| transpile_expr(a, indent, depth))
+                .enumerate()
+                .map(|(i, a)| {
+                    if i == 0 && reads_first_arg {
+                        transpile_read_only(a, indent, depth)
+                    } else {
+                        transpile_expr(a, indent, depth)
+                    }
+                })
                 .collect();
             let arg_codes = arg_codes?;
 
@@ -258,14 +379,26 @@ fn transpile_expr(expr: &Expr, indent: &str, depth: usize) -> Result<String, Tra
                     "len({} if {} is not None else [])",
                     arg_codes[0], arg_codes[0]
                 )),
-                "first" => Ok(format!(
-                    "({}[0] if {} and len({}) > 0 else None)",
-                    arg_codes[0], arg_codes[0], arg_codes[0]
-                )),
-                "last" => Ok(format!(
-                    "({}[-1] if {} and len({}) > 0 else None)",
-                    arg_codes[0], arg_codes[0], arg_codes[0]
-                )),
+                "first" | "last" => match dict_view_call(&args[0]) {
+                    // Take the end of keys()/values() from the dict's own
+                    // iterator instead of materialising the whole list
+                    Some((dict, method)) => {
+                        let dict_code = transpile_expr(dict, indent, depth)?;
+                        let iterate = if name == "first" { "iter" } else { "reversed" };
+                        Ok(format!(
+                            "(next({}({}.{}()), None) if {} else None)",
+                            iterate, dict_code, method, dict_code
+                        ))
+                    }
+                    None if name == "first" => Ok(format!(
+                        "({}[0] if {} and len({}) > 0 else None)",
+                        arg_codes[0], arg_codes[0], arg_codes[0]
+                    )),
+                    None => Ok(format!(
+                        "({}[-1] if {} and len({}) > 0 else None)",
+                        arg_codes[0], arg_codes[0], arg_codes[0]
+                    )),
+                },
                 "contains" => Ok(format!("({} in {})", arg_codes[1], arg_codes[0])),
                 "sum" => Ok(format!(
                     "sum({} if {} is not None else [])",
@@ -275,6 +408,11 @@ fn transpile_expr(expr: &Expr, indent: &str, depth: usize) -> Result<String, Tra
                     "(sum({}) / len({}) if {} and len({}) > 0 else None)",
                     arg_codes[0], arg_codes[0], arg_codes[0], arg_codes[0]
                 )),
+                // A list built by this expression has no other owner, so it
+                // can be sorted in place rather than copied by sorted()
+                "sort" if is_fresh_list(&args[0]) => {
+                    Ok(format!("_sort_arr_inplace({})", arg_codes[0]))
+                }
                 "sort" => Ok(format!(
                     "sorted({} if {} is not None else [])",
                     arg_codes[0], arg_codes[0]
@@ -288,24 +426,42 @@ fn transpile_expr(expr: &Expr, indent: &str, depth: usize) -> Result<String, Tra
                     arg_codes[0], arg_codes[0]
                 )),
                 "reverse" => Ok(format!(
-                    "list(reversed({} if {} is not None else []))",
+                    "({} if {} is not None else [])[::-1]",
                     arg_codes[0], arg_codes[0]
                 )),
-                "at" => Ok(format!(
-                    "({}[int({})] if {} and int({}) < len({}) else None)",
-                    arg_codes[0], arg_codes[1], arg_codes[0], arg_codes[1], arg_codes[0]
-                )),
+                "at" => match constant_index(&args[1]) {
+                    // A literal index needs neither int() nor a sign check
+                    Some(k) => Ok(format!(
+                        "({}[{}] if {} and len({}) > {} else None)",
+                        arg_codes[0], k, arg_codes[0], arg_codes[0], k
+                    )),
+                    None => Ok(format!(
+                        "({}[int({})] if {} and int({}) < len({}) else None)",
+                        arg_codes[0], arg_codes[1], arg_codes[0], arg_codes[1], arg_codes[0]
+                    )),
+                },
 
                 // Logic functions
-                "choose" => Ok(format!(
-                    "({}[int({}) - 1] if {} and int({}) > 0 and int({}) <= len({}) else None)",
-                    arg_codes[1],
-                    arg_codes[0],
-                    arg_codes[1],
-                    arg_codes[0],
-                    arg_codes[0],
-                    arg_codes[1]
-                )),
+                "choose" => match constant_index(&args[0]) {
+                    Some(0) => Ok("None".to_string()),
+                    Some(k) => Ok(format!(
+                        "({}[{}] if {} and len({}) >= {} else None)",
+                        arg_codes[1],
+                        k - 1,
+                        arg_codes[1],
+                        arg_codes[1],
+                        k
+                    )),
+                    None => Ok(format!(
+                        "({}[int({}) - 1] if {} and int({}) > 0 and int({}) <= len({}) else None)",
+                        arg_codes[1],
+                        arg_codes[0],
+                        arg_codes[1],
+                        arg_codes[0],
+                        arg_codes[0],
+                        arg_codes[1]
+                    )),
+                },
                 "if_then_else" => Ok(format!(
                     "({} if _is_truthy({}) else {})",
                     arg_codes[1], arg_codes[0], arg_codes[2]
@@ -399,6 +555,57 @@ fn transpile_expr(expr: &Expr, indent: &str, depth: usize) -> Result<String, Tra
     }
 }
 
+/// The value of a non-negative integer literal, for indexes known at compile time
+fn constant_index(expr: &Expr) -> Option<u64> {
+    match expr {
+        Expr::Number(n) if *n >= 0.0 && n.fract() == 0.0 && *n <= u32::MAX as f64 => {
+            Some(*n as u64)
+        }
+        _ => None,
+    }
+}
+
+/// Transpile an argument that is only read (iterated, measured or tested for
+/// membership), emitting dict views for keys()/values() instead of lists
+fn transpile_read_only(expr: &Expr, indent: &str, depth: usize) -> Result<String, TranspileError> {
+    if let Some((dict, method)) = dict_view_call(expr) {
+        let dict_code = transpile_expr(dict, indent, depth)?;
+        return Ok(format!(
+            "({}.{}() if {} is not None else ())",
+            dict_code, method, dict_code
+        ));
+    }
+    transpile_expr(expr, indent, depth)
+}
+
+/// Whether the generated code for `expr` always evaluates to a newly built
+/// list that nothing else references (literals, split, reverse, sort)
+fn is_fresh_list(expr: &Expr) -> bool {
+    match expr {
+        Expr::Array(_) => true,
+        Expr::FunctionCall { name, args } => match name.as_str() {
+            "split" => args.len() == 2,
+            "reverse" => args.len() == 1,
+            "sort" => args.len() == 1,
+            _ => false,
+        },
+        _ => false,
+    }
+}
+
+/// For a `keys(d)` or `values(d)` call, the dictionary expression and the
+/// matching Python dict method
+fn dict_view_call(expr: &Expr) -> Option<(&Expr, &str)> {
+    match expr {
+        Expr::FunctionCall { name, args } if args.len() == 1 => match name.as_str() {
+            "keys" => Some((&args[0], "keys")),
+            "values" => Some((&args[0], "values")),
+            _ => None,
+        },
+        _ => None,
+    }
+}
+
 /// Transpile Amoskeag source code to Python
 ///
 /// This is a convenience function that parses and transpiles in one step.
@@ -474,6 +681,24 @@ mod tests {
         assert!(python.contains("\"age\""));
     }
 
+    #[test]
+    fn test_transpile_deep_variable() {
+        let config = TranspileConfig {
+            include_runtime_imports: false,
+            ..Default::default()
+        };
+
+        let expr = parse("policy.driver.age").unwrap();
+        let python = transpile(&expr, &config).unwrap();
+        assert!(python.contains("_get_nested3(data, \"policy\", \"driver\", \"age\")"));
+
+        let expr = parse("policy.driver.license.state").unwrap();
+        let python = transpile(&expr, &config).unwrap();
+        assert!(
+            python.contains("_get_nested(data, \"policy\", \"driver\", \"license\", \"state\")")
+        );
+    }
+
     #[test]
     fn test_transpile_binary_op() {
         let expr = parse("1 + 2").unwrap();
@@ -497,6 +722,119 @@ mod tests {
         assert!(python.contains(".upper()"));
     }
 
+    #[test]
+    fn test_transpile_arithmetic_functions_inline() {
+        let expr = parse("plus(times(price, 2), minus(tax, 1))").unwrap();
+        let config = TranspileConfig {
+            include_runtime_imports: false,
+            ..Default::default()
+        };
+        let python = transpile(&expr, &config).unwrap();
+        assert!(python.contains("((data.get(\"price\") * 2) + (data.get(\"tax\") - 1))"));
+        assert!(!python.contains("plus("));
+    }
+
+    #[test]
+    fn test_transpile_keys_view_when_read_only() {
+        let config = TranspileConfig {
+            include_runtime_imports: false,
+            ..Default::default()
+        };
+
+        let expr = parse("size(keys(coverages))").unwrap();
+        let python = transpile(&expr, &config).unwrap();
+        assert!(python.contains("data.get(\"coverages\").keys() if"));
+        assert!(!python.contains("list("));
+
+        let expr = parse("contains(keys(coverages), [1])").unwrap();
+        let python = transpile(&expr, &config).unwrap();
+        assert!(python.contains("([1] in list(data.get(\"coverages\").keys()"));
+
+        let expr = parse("contains(values(coverages), [1])").unwrap();
+        let python = transpile(&expr, &config).unwrap();
+        assert!(python.contains("([1] in (data.get(\"coverages\").values() if"));
+
+        let expr = parse("keys(coverages)").unwrap();
+        let python = transpile(&expr, &config).unwrap();
+        assert!(python.contains("list(data.get(\"coverages\").keys()"));
+    }
+
+    #[test]
+    fn test_transpile_constant_index() {
+        let config = TranspileConfig {
+            include_runtime_imports: false,
+            ..Default::default()
+        };
+
+        let python = transpile(&parse("at(drivers, 1)").unwrap(), &config).unwrap();
+        assert!(python.contains("data.get(\"drivers\")[1] if"));
+        assert!(!python.contains("int("));
+
+        let python = transpile(&parse("choose(2, [:a, :b])").unwrap(), &config).unwrap();
+        assert!(python.contains("[\":a\", \":b\"][1] if"));
+        assert!(!python.contains("int("));
+
+        let python = transpile(&parse("at(drivers, index)").unwrap(), &config).unwrap();
+        assert!(python.contains("int(data.get(\"index\"))"));
+    }
+
+    #[test]
+    fn test_transpile_first_last_of_keys() {
+        let config = TranspileConfig {
+            include_runtime_imports: false,
+            ..Default::default()
+        };
+
+        let python = transpile(&parse("first(keys(rates))").unwrap(), &config).unwrap();
+        assert!(python.contains("next(iter(data.get(\"rates\").keys()), None)"));
+
+        let python = transpile(&parse("last(values(rates))").unwrap(), &config).unwrap();
+        assert!(python.contains("next(reversed(data.get(\"rates\").values()), None)"));
+        assert!(!python.contains("list("));
+    }
+
+    #[test]
+    fn test_transpile_sort_temporary_in_place() {
+        let config = TranspileConfig {
+            include_runtime_imports: false,
+            ..Default::default()
+        };
+
+        let python = transpile(&parse("sort(split(codes, ','))").unwrap(), &config).unwrap();
+        assert!(python.contains("_sort_arr_inplace(data.get(\"codes\").split(\",\"))"));
+
+        let python = transpile(&parse("sort(codes)").unwrap(), &config).unwrap();
+        assert!(python.contains("sorted(data.get(\"codes\")"));
+    }
+
+    #[test]
+    fn test_transpile_join_split_fusion() {
+        let source = "'a,b,c' | split(',') | join('-')";
+        let expr = parse(source).unwrap();
+        let config = TranspileConfig {
+            include_runtime_imports: false,
+            ..Default::default()
+        };
+        let python = transpile(&expr, &config).unwrap();
+        assert!(python.contains("\"a,b,c\".replace(\",\", \"-\")"));
+        assert!(!python.contains(".split("));
+    }
+
+    #[test]
+    fn test_transpile_runtime_module() {
+        let expr = parse("if driver.age > 16 :continue else :deny end").unwrap();
+        let config = TranspileConfig {
+            runtime_module: Some("amoskeag_runtime".to_string()),
+            ..Default::default()
+        };
+        let python = transpile(&expr, &config).unwrap();
+        assert!(python.contains("from amoskeag_runtime import get_nested as _get_nested, "));
+        assert!(python.contains("get_nested2 as _get_nested2"));
+        assert!(python.contains("get_nested3 as _get_nested3"));
+        assert!(!python.contains("def _get_nested"));
+        assert!(!python.contains("def _is_truthy"));
+    }
+
     #[test]
     fn test_transpile_if_expression() {
         let source = "if age > 18 :adult else :minor end";